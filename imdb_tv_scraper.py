@@ -1,172 +1,360 @@
 #!/usr/bin/env python3
 """
 IMDb TV Show Data Scraper for TMDB Import
-Uses Cinemagoer (formerly IMDbPY) to fetch TV show data from IMDb
+Fetches TV show data from IMDb's suggestion endpoint and title pages
 """
 
+import asyncio
 import csv
-import time
-import os
+import html
+import json
 import logging
+import re
+import sqlite3
+import sys
+import os
+import time
+from contextlib import closing, contextmanager
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from imdb import Cinemagoer
-
-# Suppress verbose imdbpy error traces and tracebacks
-logging.getLogger('imdbpy').setLevel(logging.CRITICAL + 1)
-logging.getLogger('imdbpy').addHandler(logging.NullHandler())
-logging.getLogger('imdbpy').propagate = False
-
-def get_progress_file(output_file: str) -> str:
-    """Get progress file path."""
-    return output_file.rsplit('.', 1)[0] + '_progress.txt'
-
-def get_temp_csv(output_file: str) -> str:
-    """Get temporary CSV file path."""
-    return output_file.rsplit('.', 1)[0] + '_temp.csv'
-
-def save_progress(output_file: str, position: int):
-    """Save current position to progress file."""
-    progress_file = get_progress_file(output_file)
-    with open(progress_file, 'w') as f:
-        f.write(str(position))
-
-def load_progress(output_file: str) -> Optional[int]:
-    """Load last processed position from progress file."""
-    progress_file = get_progress_file(output_file)
-    if os.path.exists(progress_file):
-        try:
-            with open(progress_file, 'r') as f:
-                return int(f.read().strip())
-        except:
-            return None
-    return None
-
-def append_to_csv(output_file: str, row: Dict, write_header: bool = False):
-    """Append a row to CSV file."""
-    fieldnames = [
-        'Position', 'Const', 'Created', 'Modified', 'Description',
-        'Title', 'URL', 'Title Type', 'IMDb Rating', 'Runtime (mins)',
-        'Year', 'Genres', 'Num Votes', 'Release Date', 'Directors',
-        'Your Rating', 'Date Rated'
-    ]
-    
-    mode = 'w' if write_header else 'a'
-    with open(output_file, mode, newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        if write_header:
-            writer.writeheader()
-        writer.writerow(row)
-
-def append_failure(output_file: str, position: int, title: str, error: str):
-    """Immediately append failure to failed files."""
-    failed_file = output_file.rsplit('.', 1)[0] + '_failed.txt'
-    failed_list_file = output_file.rsplit('.', 1)[0] + '_failed_list.txt'
-    
-    # Write to detailed failed file
-    mode = 'a' if os.path.exists(failed_file) else 'w'
-    with open(failed_file, mode, encoding='utf-8') as f:
-        if mode == 'w':
-            f.write("FAILED TITLES\n")
-            f.write("=" * 80 + "\n\n")
-        f.write(f"Position: {position}\n")
-        f.write(f"Title: {title}\n")
-        f.write(f"Error: {error}\n")
-        f.write("-" * 80 + "\n")
-    
-    # Write to simple failed list
-    with open(failed_list_file, 'a', encoding='utf-8') as f:
-        f.write(f"{title}\n")
-
-def search_tv_show(ia: Cinemagoer, title: str, max_retries: int = 3) -> Tuple[Optional[Dict], Optional[str]]:
+from urllib.parse import quote
+
+import httpx
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
+try:
+    import orjson
+except ImportError:  # Optional, only speeds up --jsonl output
+    orjson = None
+
+SUGGESTION_URL = "https://v3.sg.media-imdb.com/suggestion/x/{}.json"
+TITLE_URL = "https://www.imdb.com/title/{}/"
+TV_KINDS = ('tvSeries', 'tvMiniSeries')
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+MAX_CONNECTIONS = 20
+DEFAULT_WORKERS = 10
+DEFAULT_QPS = 5.0
+MAX_ATTEMPTS = 3
+MAX_RETRY_WAIT = 16  # seconds; also caps a server's Retry-After
+CACHE_TTL = 7 * 24 * 3600  # seconds a cached search result is reused for
+# HTTP errors worth retrying, with the message reported for them
+RETRY_STATUSES = {
+    405: "HTTP 405: Not Allowed",
+    429: "HTTP 429: Too Many Requests",
+}
+
+# Column order of the TMDB import CSV; extract_show_data returns rows in this order
+FIELDNAMES = (
+    'Position', 'Const', 'Created', 'Modified', 'Description',
+    'Title', 'URL', 'Title Type', 'IMDb Rating', 'Runtime (mins)',
+    'Year', 'Genres', 'Num Votes', 'Release Date', 'Directors',
+    'Your Rating', 'Date Rated'
+)
+
+logger = logging.getLogger('imdb_tv_scraper')
+
+# Suppress httpx's log line for every request
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+_LD_JSON_RE = re.compile(r'<script type="application/ld\+json">(.*?)</script>', re.DOTALL)
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?')
+_TITLE_YEAR_RE = re.compile(r'(.+?)\s*\((\d{4})\)')
+
+def title_key(title: str) -> str:
+    """Normalize a title for cache lookups and duplicate detection."""
+    return title.strip().casefold()
+
+def open_cache(cache_db: str) -> sqlite3.Connection:
+    """Open the search cache, creating its table on first use."""
+    cache = sqlite3.connect(cache_db)
+    # Drop the pickled table written by earlier versions
+    cache.execute("DROP TABLE IF EXISTS cache")
+    cache.execute("CREATE TABLE IF NOT EXISTS shows (key TEXT PRIMARY KEY, payload TEXT, ts INTEGER)")
+    return cache
+
+def load_cached_show(cache: sqlite3.Connection, title: str) -> Optional[Dict]:
+    """Return the cached search result for a title, if any younger than CACHE_TTL."""
+    row = cache.execute("SELECT payload FROM shows WHERE key = ? AND ts >= ?",
+                        (title_key(title), int(time.time()) - CACHE_TTL)).fetchone()
+    return json.loads(row[0]) if row else None
+
+def store_cached_show(cache: sqlite3.Connection, title: str, show: Dict):
+    """Cache a search result; committed every 10 titles and at the end of the run."""
+    cache.execute("INSERT OR REPLACE INTO shows VALUES (?, ?, ?)",
+                  (title_key(title), json.dumps(show), int(time.time())))
+
+def open_journal(progress_db: str) -> sqlite3.Connection:
+    """
+    Open the progress journal, creating its table on first use.
+    
+    Every processed title gets one row: status 'ok' with the CSV row as
+    payload, or status 'failed' with the error message as payload.
+    """
+    db = sqlite3.connect(progress_db, isolation_level=None)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("CREATE TABLE IF NOT EXISTS rows "
+               "(position INTEGER PRIMARY KEY, status TEXT, title TEXT, payload TEXT)")
+    return db
+
+def record_row(db: sqlite3.Connection, position: int, status: str, title: str, payload):
+    """Journal the outcome for one title."""
+    db.execute("INSERT OR REPLACE INTO rows VALUES (?, ?, ?, ?)",
+               (position, status, title, json.dumps(payload)))
+
+def load_progress(db: sqlite3.Connection) -> Optional[int]:
+    """Load last processed position from the progress journal."""
+    return db.execute("SELECT max(position) FROM rows").fetchone()[0]
+
+def count_rows(db: sqlite3.Connection) -> Tuple[int, int]:
+    """Return (successful, failed) counts from the progress journal."""
+    counts = dict(db.execute("SELECT status, count(*) FROM rows GROUP BY status"))
+    return counts.get('ok', 0), counts.get('failed', 0)
+
+@contextmanager
+def atomic_write(path: str, mode: str = 'w', **kwargs):
+    """
+    Open a temp file next to `path` and rename it over `path` once fully written.
+    
+    An interrupted write leaves the previous file intact instead of a truncated one.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_results(db: sqlite3.Connection, output_file: str):
+    """Stream successful rows from the journal into the final CSV, in input order."""
+    rows = db.execute("SELECT payload FROM rows WHERE status = 'ok' ORDER BY position")
+    with atomic_write(output_file, newline='', buffering=1 << 16, encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        writer.writerows(json.loads(payload) for payload, in rows)
+
+def write_jsonl(db: sqlite3.Connection, jsonl_file: str):
+    """Stream successful rows from the journal into a JSON Lines file, one object per show."""
+    loads = orjson.loads if orjson else json.loads
+    dumps = orjson.dumps if orjson else (lambda obj: json.dumps(obj, ensure_ascii=False).encode('utf-8'))
+    rows = db.execute("SELECT payload FROM rows WHERE status = 'ok' ORDER BY position")
+    with atomic_write(jsonl_file, 'wb') as f:
+        f.writelines(dumps(dict(zip(FIELDNAMES, loads(payload)))) + b'\n' for payload, in rows)
+
+def write_failures(db: sqlite3.Connection, failed_file: str, failed_list_file: str):
+    """Write failed titles from the journal to the failed files."""
+    failures = db.execute("SELECT position, title, payload FROM rows WHERE status = 'failed' ORDER BY position")
+    
+    with atomic_write(failed_file, encoding='utf-8') as failed_f, \
+            atomic_write(failed_list_file, encoding='utf-8') as failed_list_f:
+        failed_f.write("FAILED TITLES\n")
+        failed_f.write("=" * 80 + "\n\n")
+        for position, title, payload in failures:
+            failed_f.write(f"Position: {position}\nTitle: {title}\nError: {json.loads(payload)}\n" + "-" * 80 + "\n")
+            failed_list_f.write(f"{title}\n")
+
+class TokenBucket:
+    """Admits requests at a steady rate, allowing short bursts up to `burst`."""
+    
+    def __init__(self, rate_per_sec: float, burst: int):
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent."""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+def pick_tv_suggestion(results: List[Dict], year: Optional[int] = None) -> Optional[Dict]:
+    """
+    Pick the TV series to fetch using only suggestion metadata.
+    
+    Args:
+        results: Suggestion endpoint entries
+        year: Start year to prefer, if the input title carried one
+        
+    Returns:
+        First TV series entry (matching `year` when possible), or None
+    """
+    tv_results = [r for r in results if r.get('qid') in TV_KINDS]
+    if year:
+        for result in tv_results:
+            if result.get('y') == year:
+                return result
+    return tv_results[0] if tv_results else None
+
+def parse_title_page(entry: Dict, page: str) -> Dict:
+    """
+    Build show data from a suggestion entry and its IMDb title page.
+    
+    Args:
+        entry: Suggestion endpoint entry (id, l, y, qid)
+        page: HTML of the title page
+        
+    Returns:
+        Dictionary with show data
+    """
+    show = {
+        'imdbID': entry['id'],
+        'title': entry.get('l', ''),
+        'year': entry.get('y', ''),
+    }
+    
+    match = _LD_JSON_RE.search(page)
+    if not match:
+        return show
+    details = json.loads(match.group(1))
+    
+    rating = details.get('aggregateRating') or {}
+    if 'ratingValue' in rating:
+        show['rating'] = rating['ratingValue']
+    if 'ratingCount' in rating:
+        show['votes'] = rating['ratingCount']
+    if details.get('datePublished'):
+        show['original air date'] = details['datePublished']
+    
+    duration = _DURATION_RE.fullmatch(details.get('duration', ''))
+    if duration and any(duration.groups()):
+        hours, minutes = (int(g or 0) for g in duration.groups())
+        show['runtimes'] = [str(hours * 60 + minutes)]
+    
+    genres = details.get('genre')
+    if genres:
+        show['genres'] = [genres] if isinstance(genres, str) else genres
+    
+    # Creators may be listed alongside production companies
+    creators = details.get('creator', [])
+    if isinstance(creators, dict):
+        creators = [creators]
+    creators = [c for c in creators if c.get('@type') == 'Person']
+    if creators:
+        show['creator'] = [html.unescape(c.get('name', '')) for c in creators]
+    
+    return show
+
+_backoff = wait_exponential_jitter(initial=1, max=MAX_RETRY_WAIT)
+
+def _is_retryable(e: BaseException) -> bool:
+    """Only rate limit / blocked responses (HTTP 429, 405) are worth retrying."""
+    return isinstance(e, httpx.HTTPStatusError) and e.response.status_code in RETRY_STATUSES
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Wait for the server's Retry-After if it sent a valid one, else jittered exponential backoff."""
+    try:
+        wait = float(retry_state.outcome.exception().response.headers['Retry-After'])
+    except (KeyError, ValueError):
+        return _backoff(retry_state)
+    # Retries sleep inside the search semaphore, so a huge Retry-After would stall every worker
+    return min(wait, MAX_RETRY_WAIT) if wait >= 0 else _backoff(retry_state)
+
+def _log_retry(retry_state: RetryCallState):
+    """Log a rate-limited request before sleeping for the next attempt."""
+    status = retry_state.outcome.exception().response.status_code
+    # _get's title, whether passed by keyword or positionally
+    title = retry_state.kwargs.get('title') or retry_state.args[2]
+    logger.warning("  ⚠️  %s: %s. Retrying in %.1fs... (%d/%d)", title, RETRY_STATUSES[status],
+                   retry_state.next_action.sleep, retry_state.attempt_number + 1, MAX_ATTEMPTS)
+
+@retry(retry=retry_if_exception(_is_retryable), wait=_retry_wait, stop=stop_after_attempt(MAX_ATTEMPTS),
+       before_sleep=_log_retry, reraise=True)
+async def _get(client: httpx.AsyncClient, bucket: TokenBucket, title: str, url: str) -> httpx.Response:
+    """GET an IMDb URL through the rate limiter, raising on HTTP errors; `title` is only used in retry logs."""
+    await bucket.acquire()
+    response = await client.get(url)
+    response.raise_for_status()
+    return response
+
+async def search_tv_show_async(client: httpx.AsyncClient, title: str, sem: asyncio.Semaphore,
+                               bucket: TokenBucket) -> Tuple[Optional[Dict], Optional[str]]:
     """
     Search for a TV show on IMDb and return the best match.
-    Uses exponential backoff on rate limit errors.
+    Requests are retried on rate limit errors (see _get).
     
     Args:
-        ia: Cinemagoer instance
+        client: Shared HTTP client
         title: TV show title to search for
-        max_retries: Maximum number of retry attempts
+        sem: Semaphore bounding the number of in-flight searches
+        bucket: Rate limiter every request is admitted through
         
     Returns:
         Tuple of (show_data, error_message)
         - show_data: Dictionary with show data or None if not found
         - error_message: Error string if failed, None if successful
     """
-    print(f"Searching for: {title}")
-    
-    for attempt in range(max_retries):
+    # "Lost in Space (2018)" is searched as "Lost in Space" and matched on the year
+    query, year = title, None
+    match = _TITLE_YEAR_RE.fullmatch(title)
+    if match:
+        query, year = match.group(1), int(match.group(2))
+    
+    async with sem:
+        logger.info("Searching for: %s", title)
         try:
             # Search for the title
-            results = ia.search_movie(title)
+            response = await _get(client, bucket, title, SUGGESTION_URL.format(quote(query, safe='')))
+            results = response.json().get('d', [])
             
             if not results:
                 error_msg = "No results found"
-                print(f"  ⚠️  {error_msg}")
+                logger.warning("  ⚠️  %s: %s", title, error_msg)
                 return None, error_msg
             
-            # Find the first TV series in results
-            for result in results:
-                try:
-                    # Get full details
-                    ia.update(result, info=['main'])
-                    
-                    # Check if it's a TV series
-                    if result.get('kind') in ['tv series', 'tv mini series']:
-                        print(f"  ✓ Found: {result.get('title')} ({result.get('year', 'N/A')})")
-                        return result, None
-                except Exception as e:
-                    # Skip this result and try next one
-                    continue
+            # Pick the TV series from suggestion metadata; only it gets a detail fetch
+            result = pick_tv_suggestion(results, year)
+            if result:
+                response = await _get(client, bucket, title, TITLE_URL.format(result['id']))
+                show = parse_title_page(result, response.text)
+                logger.info("  ✓ Found: %s (%s)", show['title'], show.get('year') or 'N/A')
+                return show, None
             
             error_msg = "No TV series found in results"
-            print(f"  ⚠️  {error_msg}")
+            logger.warning("  ⚠️  %s: %s", title, error_msg)
             return None, error_msg
-            
+        
         except Exception as e:
             error_type = type(e).__name__
-            error_msg = str(e)
-            
-            # Clean up verbose error messages
-            if isinstance(e, dict) or error_msg.startswith('{'):
-                # Extract just the important bits from IMDb error dict
-                if '405' in error_msg:
-                    error_msg = "HTTP 405: Not Allowed"
-                elif '429' in error_msg:
-                    error_msg = "HTTP 429: Too Many Requests"
-                else:
-                    error_msg = "HTTP error"
-            
-            # Check if it's an HTTP error that might benefit from retry
-            if '405' in error_msg or '429' in error_msg or 'Too Many Requests' in error_msg:
-                if attempt < max_retries - 1:
-                    # Exponential backoff: 2, 4, 8 seconds
-                    backoff_delay = 2 ** (attempt + 1)
-                    print(f"  ⚠️  {error_msg}. Retrying in {backoff_delay}s... ({attempt + 2}/{max_retries})")
-                    time.sleep(backoff_delay)
-                    continue
-                else:
-                    print(f"  ❌ {error_msg} - max retries reached")
-                    return None, f"{error_type}: {error_msg}"
+            if _is_retryable(e):
+                error_msg = RETRY_STATUSES[e.response.status_code]
+                logger.warning("  ❌ %s: %s - max retries reached", title, error_msg)
             else:
-                # Non-retryable error, don't retry
-                print(f"  ❌ {error_msg}")
-                return None, f"{error_type}: {error_msg}"
-    
-    return None, "Max retries exceeded"
+                # Non-retryable error, not retried
+                error_msg = str(e).splitlines()[0] if str(e) else error_type
+                logger.warning("  ❌ %s: %s", title, error_msg)
+            return None, f"{error_type}: {error_msg}"
 
-def extract_show_data(show: Dict) -> Dict:
+def extract_show_data(show: Dict, position: int, today: str) -> Tuple:
     """
     Extract relevant data from IMDb show object for CSV export.
     
     Args:
-        show: IMDb show object
+        show: Show data from search_tv_show_async
+        position: Position of the title in the input list
+        today: Run date (YYYY-MM-DD) for the Created/Modified columns
         
     Returns:
-        Dictionary with formatted data for CSV
+        CSV row ordered as FIELDNAMES
     """
     # Get basic info
-    imdb_id = f"tt{show.movieID}"
+    imdb_id = show['imdbID']
     title = show.get('title', '')
     url = f"https://www.imdb.com/title/{imdb_id}/"
     
@@ -194,33 +382,17 @@ def extract_show_data(show: Dict) -> Dict:
     # Creators/Directors (for TV shows, these are usually the creators)
     creators = ''
     if 'creator' in show:
-        creators = ', '.join([str(c) for c in show['creator']])
-    elif 'director' in show:
-        creators = ', '.join([str(d) for d in show['director']])
-    
-    # Current timestamp for created/modified
-    now = datetime.now().strftime('%Y-%m-%d')
-    
-    return {
-        'Const': imdb_id,
-        'Title': title,
-        'URL': url,
-        'Title Type': 'tvSeries',
-        'IMDb Rating': rating,
-        'Runtime (mins)': runtime,
-        'Year': year,
-        'Genres': genres,
-        'Num Votes': votes,
-        'Release Date': release_date,
-        'Directors': creators,
-        'Created': now,
-        'Modified': now,
-        'Description': '',
-        'Your Rating': '',
-        'Date Rated': ''
-    }
+        creators = ', '.join(show['creator'])
+    
+    return (
+        position, imdb_id, today, today, '',
+        title, url, 'tvSeries', rating, runtime,
+        year, genres, votes, release_date, creators,
+        '', ''
+    )
 
-def process_tv_list(input_file: str, output_file: str, delay: float = 0.0):
+async def process_tv_list(input_file: str, output_file: str, qps: float = DEFAULT_QPS,
+                          workers: int = DEFAULT_WORKERS, jsonl: bool = False):
     """
     Process TV show list and create TMDB-compatible CSV.
     Supports resume from interruption.
@@ -228,117 +400,143 @@ def process_tv_list(input_file: str, output_file: str, delay: float = 0.0):
     Args:
         input_file: Path to text file with TV show titles (one per line)
         output_file: Path to output CSV file
-        delay: Delay in seconds between requests (0 = no delay)
+        qps: Maximum IMDb requests per second
+        workers: Maximum number of titles looked up at the same time
+        jsonl: Also write successful results as JSON Lines next to the CSV
     """
-    # Initialize Cinemagoer
-    ia = Cinemagoer()
+    # Created/Modified date, fixed for the whole run
+    today = datetime.now().strftime('%Y-%m-%d')
     
     # Read TV show list
-    print(f"\n📺 Reading TV shows from: {input_file}")
-    with open(input_file, 'r', encoding='utf-8') as f:
-        tv_shows = [line.strip() for line in f if line.strip()]
+    logger.info("\n📺 Reading TV shows from: %s", input_file)
+    with open(input_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        raw = f.read()
+    tv_shows = [s for s in map(str.strip, raw.splitlines()) if s]
     
-    print(f"Found {len(tv_shows)} TV shows to process")
-    if delay > 0:
-        print(f"⏱️  Using {delay}s delay between requests")
+    logger.info("Found %d TV shows to process", len(tv_shows))
+    logger.info("⏱️  Limiting to %g requests per second, %d titles at a time", qps, workers)
     
     # Check for resume
-    temp_csv = get_temp_csv(output_file)
-    last_position = load_progress(output_file)
-    start_position = 1
-    
-    if last_position and os.path.exists(temp_csv):
-        print(f"\n⚠️  Found partial progress at position {last_position}")
-        response = input(f"Resume from position {last_position + 1}? (y/n): ").strip().lower()
-        if response == 'y':
-            start_position = last_position + 1
-            print(f"✓ Resuming from position {start_position}")
-        else:
-            print("✓ Starting from beginning")
-            start_position = 1
-            # Clean up old files
-            if os.path.exists(temp_csv):
-                os.remove(temp_csv)
-            progress_file = get_progress_file(output_file)
-            if os.path.exists(progress_file):
-                os.remove(progress_file)
-    
-    # Initialize temp CSV if starting fresh
-    if start_position == 1:
-        append_to_csv(temp_csv, {}, write_header=True)
-    
-    print()
-    
-    # Process each show
-    results = []
-    failed_count = 0
-    success_count = 0
-    
-    for position, title in enumerate(tv_shows, start=1):
-        # Skip already processed
-        if position < start_position:
-            continue
+    stem = os.path.splitext(output_file)[0]
+    progress_db = f"{stem}_progress.db"
+    jsonl_file = f"{stem}.jsonl"
+    failed_file = f"{stem}_failed.txt"
+    failed_list_file = f"{stem}_failed_list.txt"
+    cache_db = f"{stem}.cache.db"
+    with closing(open_journal(progress_db)) as db, \
+            closing(open_cache(cache_db)) as cache:
+        last_position = load_progress(db)
+        start_position = 1
         
-        show, error = search_tv_show(ia, title)
+        if last_position:
+            logger.warning("\n⚠️  Found partial progress at position %d", last_position)
+            response = input(f"Resume from position {last_position + 1}? (y/n): ").strip().lower()
+            if response == 'y':
+                start_position = last_position + 1
+                logger.info("✓ Resuming from position %d", start_position)
+            else:
+                logger.info("✓ Starting from beginning")
+                start_position = 1
+                # Clear the old journal
+                db.execute("DELETE FROM rows")
         
-        if show:
-            try:
-                show_data = extract_show_data(show)
-                show_data['Position'] = position
-                results.append(show_data)
-                
-                # Write successful result to temp CSV
-                append_to_csv(temp_csv, show_data)
-                success_count += 1
-            except Exception as e:
-                # Failed to extract data
-                error_msg = f"Data extraction failed: {type(e).__name__}: {str(e)}"
-                print(f"  ❌ {error_msg}")
-                
-                # Immediately write failure (NOT to CSV, only to failed files)
-                append_failure(output_file, position, title, error_msg)
-                failed_count += 1
-        else:
-            # Failed to find show
-            error_msg = error if error else 'Not found'
-            
-            # Immediately write failure (NOT to CSV, only to failed files)
-            append_failure(output_file, position, title, error_msg)
-            failed_count += 1
+        logger.info("")
         
-        # Save progress every 10 titles
-        if position % 10 == 0:
-            save_progress(output_file, position)
-            print(f"💾 Progress saved: {position}/{len(tv_shows)} ({success_count} successful, {failed_count} failed)")
+        # Process each show
+        success_count, failed_count = count_rows(db)
         
-        # Optional delay between requests
-        if delay > 0 and position < len(tv_shows):
-            print(f"⏳ Waiting {delay}s before next request...")
-            time.sleep(delay)
+        # One keep-alive HTTP/2 connection pool shared by all searches; the semaphore bounds in-flight titles
+        limits = httpx.Limits(max_keepalive_connections=workers, max_connections=max(workers, MAX_CONNECTIONS))
+        # The transport also retries failed connection attempts
+        transport = httpx.AsyncHTTPTransport(http2=True, limits=limits, retries=3)
+        async with httpx.AsyncClient(headers=HEADERS, timeout=10.0, follow_redirects=True,
+                                     transport=transport) as client:
+            sem = asyncio.Semaphore(workers)
+            bucket = TokenBucket(qps, burst=workers)
+            pending = list(enumerate(tv_shows, start=1))[start_position - 1:]
+            
+            # Duplicate titles share one lookup; only titles missing from the cache go to the network
+            cached = {}
+            tasks = {}
+            for _, title in pending:
+                key = title_key(title)
+                if key in cached or key in tasks:
+                    continue
+                show = load_cached_show(cache, title)
+                if show is not None:
+                    cached[key] = show
+                else:
+                    tasks[key] = asyncio.create_task(search_tv_show_async(client, title, sem, bucket))
+            
+            duplicates = len(pending) - len(cached) - len(tasks)
+            if duplicates:
+                logger.info("🔁 %d duplicate titles will reuse the first lookup\n", duplicates)
+            
+            try:
+                # Consume in input order so the journal never skips an unfinished title
+                seen = set()
+                for position, title in pending:
+                    key = title_key(title)
+                    show, error = cached.get(key), None
+                    if key in seen:
+                        if show:
+                            logger.info("  ✓ Duplicate of an earlier title: %s (%s)",
+                                        show['title'], show.get('year') or 'N/A')
+                        else:
+                            # A finished task returns the same failure to every duplicate
+                            show, error = await tasks[key]
+                    elif show:
+                        logger.info("  ✓ Cached: %s (%s)", show['title'], show.get('year') or 'N/A')
+                    else:
+                        show, error = await tasks[key]
+                        if show:
+                            store_cached_show(cache, title, show)
+                            cached[key] = show
+                    seen.add(key)
+                    
+                    if show:
+                        try:
+                            show_data = extract_show_data(show, position, today)
+                            
+                            # Journal successful result
+                            record_row(db, position, 'ok', title, show_data)
+                            success_count += 1
+                        except Exception as e:
+                            # Failed to extract data
+                            error_msg = f"Data extraction failed: {type(e).__name__}: {str(e)}"
+                            logger.warning("  ❌ %s", error_msg)
+                            
+                            # Immediately journal failure (NOT written to CSV)
+                            record_row(db, position, 'failed', title, error_msg)
+                            failed_count += 1
+                    else:
+                        # Failed to find show
+                        error_msg = error if error else 'Not found'
+                        
+                        # Immediately journal failure (NOT written to CSV)
+                        record_row(db, position, 'failed', title, error_msg)
+                        failed_count += 1
+                    
+                    # Report progress every 10 titles
+                    if position % 10 == 0:
+                        cache.commit()
+                        logger.info("💾 Progress saved: %d/%d (%d successful, %d failed)",
+                                    position, len(tv_shows), success_count, failed_count)
+            finally:
+                for task in tasks.values():
+                    task.cancel()
+                cache.commit()
         
-        print()  # Empty line between results
-    
-    # Final write - copy temp to final
-    print(f"\n📝 Writing final results to: {output_file}")
-    
-    fieldnames = [
-        'Position', 'Const', 'Created', 'Modified', 'Description',
-        'Title', 'URL', 'Title Type', 'IMDb Rating', 'Runtime (mins)',
-        'Year', 'Genres', 'Num Votes', 'Release Date', 'Directors',
-        'Your Rating', 'Date Rated'
-    ]
-    
-    with open(output_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
-    
-    # Clean up temp and progress files
-    if os.path.exists(temp_csv):
-        os.remove(temp_csv)
-    progress_file = get_progress_file(output_file)
-    if os.path.exists(progress_file):
-        os.remove(progress_file)
+        # Final write - stream journaled rows into the output files
+        logger.info("\n📝 Writing final results to: %s", output_file)
+        write_results(db, output_file)
+        if jsonl:
+            write_jsonl(db, jsonl_file)
+        if failed_count > 0:
+            write_failures(db, failed_file, failed_list_file)
+    
+    # Clean up progress journal
+    os.remove(progress_db)
     
     # Print summary
     print(f"\n{'='*80}")
@@ -348,47 +546,84 @@ def process_tv_list(input_file: str, output_file: str, delay: float = 0.0):
     print(f"❌ Failed to process: {failed_count}/{len(tv_shows)} shows")
     print(f"\nOutput files:")
     print(f"  - Main CSV: {output_file} (successful results only)")
+    if jsonl:
+        print(f"  - JSON Lines: {jsonl_file}")
     if failed_count > 0:
-        print(f"  - Failed details: {output_file.rsplit('.', 1)[0]}_failed.txt")
-        print(f"  - Failed list: {output_file.rsplit('.', 1)[0]}_failed_list.txt")
+        print(f"  - Failed details: {failed_file}")
+        print(f"  - Failed list: {failed_list_file}")
     print(f"{'='*80}\n")
 
 def main():
     """Main entry point."""
-    import sys
+    # Prefer uvloop's faster event loop where it is installed (not available on Windows);
+    # uvloop.run needs uvloop >= 0.18, so older installs fall back to asyncio.run too
+    try:
+        import uvloop
+        run = getattr(uvloop, 'run', asyncio.run)
+    except ImportError:
+        run = asyncio.run
     
     if len(sys.argv) < 2:
-        print("Usage: python imdb_tv_scraper.py <input_file> [output_file] [--delay=N]")
+        print("Usage: python imdb_tv_scraper.py <input_file> [output_file] [--qps=N] [--workers=N] [--jsonl] [--quiet]")
         print("\nExample:")
         print("  python imdb_tv_scraper.py tv_list.txt tv_shows_imdb.csv")
-        print("  python imdb_tv_scraper.py tv_list.txt tv_shows_imdb.csv --delay=2")
+        print("  python imdb_tv_scraper.py tv_list.txt tv_shows_imdb.csv --qps=2")
         print("\nOptions:")
-        print("  --delay=N    Add N second delay between requests (default: 0)")
+        print(f"  --qps=N      Send at most N requests per second (default: {DEFAULT_QPS:g})")
+        print(f"  --workers=N  Look up at most N titles at the same time (default: {DEFAULT_WORKERS})")
+        print("  --jsonl      Also write results as JSON Lines (faster with orjson installed)")
+        print("  --quiet      Only log warnings and the final summary")
         print("\nFeatures:")
-        print("  - Exponential backoff on errors (automatic)")
-        print("  - Incremental progress saves every 10 titles")
+        print("  - Retry-After / jittered exponential backoff on errors (automatic)")
+        print("  - Progress journaled after every title")
         print("  - Resume capability if interrupted")
-        print("  - Immediate failure logging")
+        print("  - Failed titles listed in separate files")
         print("  - Only successful results in main CSV")
         sys.exit(1)
     
     input_file = sys.argv[1]
     output_file = 'tv_shows_imdb.csv'
-    delay = 0.0
+    qps = DEFAULT_QPS
+    workers = DEFAULT_WORKERS
+    jsonl = False
+    quiet = False
     
     # Parse arguments
     for arg in sys.argv[2:]:
-        if arg.startswith('--delay='):
+        if arg.startswith('--qps='):
+            try:
+                qps = float(arg.split('=')[1])
+            except ValueError:
+                qps = 0
+            if qps <= 0:
+                print(f"❌ Invalid qps value: {arg}")
+                sys.exit(1)
+        elif arg.startswith('--workers='):
             try:
-                delay = float(arg.split('=')[1])
+                workers = int(arg.split('=')[1])
             except ValueError:
-                print(f"❌ Invalid delay value: {arg}")
+                workers = 0
+            if workers <= 0:
+                print(f"❌ Invalid workers value: {arg}")
                 sys.exit(1)
+        elif arg == '--jsonl':
+            jsonl = True
+        elif arg == '--quiet':
+            quiet = True
         elif not arg.startswith('--'):
             output_file = arg
     
+    # --jsonl writes <stem>.jsonl, which would replace a CSV output named that way
+    if jsonl and os.path.splitext(output_file)[1].lower() == '.jsonl':
+        print(f"❌ Output file '{output_file}' would be overwritten by --jsonl; use a .csv name")
+        sys.exit(1)
+    
+    # Per-title lines are info level, so --quiet skips formatting them entirely
+    logging.basicConfig(level=logging.WARNING if quiet else logging.INFO, format='%(message)s',
+                        handlers=[logging.StreamHandler(sys.stdout)])
+    
     try:
-        process_tv_list(input_file, output_file, delay)
+        run(process_tv_list(input_file, output_file, qps, workers, jsonl))
     except FileNotFoundError:
         print(f"❌ Error: Input file '{input_file}' not found")
         sys.exit(1)